@@ -1,15 +1,17 @@
 from festim import DirichletBC, BoundaryConditionExpression, k_B
 import fenics as f
 import sympy as sp
+import numpy as np
 
 
 def dc_imp(T, phi, R_p, D_0, E_D, Kr_0=None, E_Kr=None, Kd_0=None, E_Kd=None, P=None):
-    D = D_0 * f.exp(-E_D / k_B / T)
+    D = D_0 * np.exp(-E_D / k_B / T)
     value = phi * R_p / D
     if Kr_0 is not None:
-        Kr = Kr_0 * f.exp(-E_Kr / k_B / T)
-        if Kd_0 is not None:
-            Kd = Kd_0 * f.exp(-E_Kd / k_B / T)
+        Kr = Kr_0 * np.exp(-E_Kr / k_B / T)
+        # without a partial pressure there is no dissociation flux
+        if Kd_0 is not None and P is not None:
+            Kd = Kd_0 * np.exp(-E_Kd / k_B / T)
             value += ((phi + Kd * P) / Kr) ** 0.5
         else:
             value += (phi / Kr) ** 0.5
@@ -41,7 +43,9 @@ class ImplantationDirichlet(DirichletBC):
             assumed. Defaults to None.
         E_Kd (float, optional): dissociation coefficient activation
             energy (eV). Defaults to None.
-        P (float or sp.Expr, optional): partial pressure of H (Pa). Defaults to None.
+        P (float or sp.Expr, optional): partial pressure of H (Pa). If None,
+            there is no dissociation flux and Kd_0 and E_Kd are ignored.
+            Defaults to None.
     """
 
     def __init__(
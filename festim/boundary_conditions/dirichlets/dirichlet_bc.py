@@ -1,6 +1,6 @@
-from festim import BoundaryCondition, k_B
+from festim import BoundaryCondition, k_B, as_expression_of_t
 import fenics as f
-import sympy as sp
+import numpy as np
 
 
 class DirichletBC(BoundaryCondition):
@@ -26,11 +26,8 @@ class DirichletBC(BoundaryCondition):
         Args:
             T (fenics.Function): temperature
         """
-        value_BC = sp.printing.ccode(self.value)
-        value_BC = f.Expression(value_BC, t=0, degree=4)
         # TODO : why degree 4?
-
-        self.expression = value_BC
+        self.expression = as_expression_of_t(self.value, degree=4)
 
     def normalise_by_solubility(self, materials, volume_markers, T):
         """Normalise self.expression by the solubility
@@ -119,7 +116,7 @@ class BoundaryConditionTheta(f.UserExpression):
         S_0 = material.S_0
         E_S = material.E_S
         c = self._bci(x)
-        S = S_0 * f.exp(-E_S / k_B / self._T(x))
+        S = S_0 * np.exp(-E_S / k_B / self._T(x))
         if material.solubility_law == "sievert":
             value[0] = c / S
         elif material.solubility_law == "henry":
@@ -144,17 +141,33 @@ class BoundaryConditionExpression(f.UserExpression):
         self.eval_function = eval_function
         self.prms = kwargs
 
+    @property
+    def prms(self):
+        return self._prms
+
+    @prms.setter
+    def prms(self, value):
+        self._prms = value
+        # sort the parameters once so that eval doesn't have to inspect
+        # them at every evaluation point
+        self._static_prms = {}
+        self._constant_prms = {}
+        self._spatial_prms = {}
+        for key, prm_val in value.items():
+            if isinstance(prm_val, f.Constant):
+                self._constant_prms[key] = prm_val
+            elif callable(prm_val):
+                self._spatial_prms[key] = prm_val
+            else:
+                self._static_prms[key] = prm_val
+
     def eval(self, value, x):
         # find local value of parameters
-        new_prms = {}
-        for key, prm_val in self.prms.items():
-            if callable(prm_val):
-                if isinstance(prm_val, f.Constant):
-                    new_prms[key] = float(prm_val)
-                else:
-                    new_prms[key] = prm_val(x)
-            else:
-                new_prms[key] = prm_val
+        new_prms = dict(self._static_prms)
+        for key, prm_val in self._constant_prms.items():
+            new_prms[key] = float(prm_val)
+        for key, prm_val in self._spatial_prms.items():
+            new_prms[key] = prm_val(x)
 
         # evaluate at local point
         value[0] = self.eval_function(self._T(x), **new_prms)
@@ -1,10 +1,11 @@
 from festim import DirichletBC, BoundaryConditionExpression, k_B
 import fenics as f
 import sympy as sp
+import numpy as np
 
 
 def henrys_law(T, H_0, E_H, pressure):
-    H = H_0 * f.exp(-E_H / k_B / T)
+    H = H_0 * np.exp(-E_H / k_B / T)
     return H * pressure
 
 
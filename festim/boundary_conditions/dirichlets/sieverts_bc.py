@@ -1,10 +1,11 @@
 from festim import DirichletBC, BoundaryConditionExpression, k_B
 import fenics as f
 import sympy as sp
+import numpy as np
 
 
 def sieverts_law(T, S_0, E_S, pressure):
-    S = S_0 * f.exp(-E_S / k_B / T)
+    S = S_0 * np.exp(-E_S / k_B / T)
     return S * pressure**0.5
 
 
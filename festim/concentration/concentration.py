@@ -1,5 +1,5 @@
 from fenics import *
-import sympy as sp
+from festim import as_expression_of_t
 
 
 class Concentration:
@@ -46,6 +46,5 @@ class Concentration:
             with XDMFFile(value) as f:
                 f.read_checkpoint(comp, label, time_step)
         else:
-            value = sp.printing.ccode(value)
-            comp = Expression(value, degree=3, t=0)
+            comp = as_expression_of_t(value, degree=3)
         return comp
@@ -40,6 +40,5 @@ class AverageSurface(SurfaceQuantity):
             return quantity_title
 
     def compute(self):
-        return f.assemble(self.function * self.ds(self.surface)) / f.assemble(
-            1 * self.ds(self.surface)
-        )
+        measure = self.ds(self.surface)
+        return f.assemble(self.function * measure) / self.measure_size(measure)
@@ -39,6 +39,5 @@ class AverageVolume(VolumeQuantity):
             return quantity_title
 
     def compute(self):
-        return f.assemble(self.function * self.dx(self.volume)) / f.assemble(
-            1 * self.dx(self.volume)
-        )
+        measure = self.dx(self.volume)
+        return f.assemble(self.function * measure) / self.measure_size(measure)
@@ -108,6 +108,18 @@ class DerivedQuantities(list):
             if not value.endswith(".csv"):
                 raise ValueError("filename must end with .csv")
         self._filename = value
+        # a new file has to be written from the first row
+        self._nb_rows_written = 0
+
+    @property
+    def data(self):
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+        # the file has to be written again from the first row
+        self._nb_rows_written = 0
 
     def make_header(self):
         header = ["t(s)"]
@@ -123,9 +135,12 @@ class DerivedQuantities(list):
 
     def assign_measures_to_quantities(self, dx, ds):
         self.volume_markers = dx.subdomain_data()
+        # the sizes of the subdomains are computed once for all quantities
+        measure_sizes = {}
         for quantity in self:
             quantity.dx = dx
             quantity.ds = ds
+            quantity.measure_sizes = measure_sizes
             quantity.n = f.FacetNormal(dx.subdomain_data().mesh())
 
     def assign_properties_to_quantities(self, materials):
@@ -168,8 +183,16 @@ class DerivedQuantities(list):
             if not os.path.exists(dirname):
                 os.makedirs(dirname, exist_ok=True)
 
-            # save the data to csv
-            np.savetxt(self.filename, np.array(self.data), fmt="%s", delimiter=",")
+            # only the rows computed since the last write are appended to
+            # the csv, the data already written isn't converted again
+            new_rows = self.data[self._nb_rows_written :]
+            mode = "w" if self._nb_rows_written == 0 else "a"
+            with open(self.filename, mode) as file:
+                if len(new_rows) > 0:
+                    np.savetxt(
+                        file, np.array(new_rows, dtype=str), fmt="%s", delimiter=","
+                    )
+            self._nb_rows_written = len(self.data)
         return True
 
     def is_export(self, t, final_time, nb_iterations):
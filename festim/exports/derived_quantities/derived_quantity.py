@@ -1,4 +1,5 @@
 from festim import Export
+import fenics as f
 
 
 class DerivedQuantity(Export):
@@ -21,6 +22,22 @@ class DerivedQuantity(Export):
         self.data = []
         self.t = []
         self.show_units = False
+        self.measure_sizes = {}
+
+    def measure_size(self, measure):
+        """Returns int(1 * measure). The value is assembled once and stored
+        in self.measure_sizes, which is shared by all the quantities of a
+        festim.DerivedQuantities
+
+        Args:
+            measure (ufl.Measure): the measure (eg. dx(1) or ds(2))
+
+        Returns:
+            float: the size of the measure
+        """
+        if measure not in self.measure_sizes:
+            self.measure_sizes[measure] = f.assemble(1 * measure)
+        return self.measure_sizes[measure]
 
 
 class VolumeQuantity(DerivedQuantity):
@@ -115,14 +115,19 @@ class Exports(list):
                     export.append = True
 
             elif isinstance(export, festim.TXTExport):
-                # if not a Function, project it onto V_DG1
-                if not isinstance(label_to_function[export.field], f.Function):
-                    label_to_function[export.field] = f.project(
-                        label_to_function[export.field], self.V_DG1
-                    )
-                export.function = label_to_function[export.field]
-                steady = self.final_time == None
-                export.write(self.t, steady)
+                # nothing to project if the export doesn't write this step
+                if export.is_it_time_to_export(self.t):
+                    # if not a Function, project it onto V_DG1
+                    if not isinstance(label_to_function[export.field], f.Function):
+                        label_to_function[export.field] = f.project(
+                            label_to_function[export.field], self.V_DG1
+                        )
+                    export.function = label_to_function[export.field]
+                    # if None, TXTExport builds its own space once and keeps it
+                    if self.V_DG1 is not None:
+                        export.V_DG1 = self.V_DG1
+                    steady = self.final_time == None
+                    export.write(self.t, steady)
         self.nb_iterations += 1
 
     def initialise_derived_quantities(self, dx, ds, materials):
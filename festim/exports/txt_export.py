@@ -18,6 +18,14 @@ class TXTExport(festim.Export):
             timesteps. Defaults to None.
         header_format (str, optional): the format of column headers.
             Defautls to ".2e".
+
+    Attributes:
+        V_DG1 (fenics.FunctionSpace): the DG1 functionspace the field is
+            projected on. If None, it is created on the mesh of the field
+            at the first export.
+        data (np.array): the exported data (x column followed by one
+            column per export time)
+        header (str): the header of the exported file
     """
 
     def __init__(self, field, filename, times=None, header_format=".2e") -> None:
@@ -29,6 +37,10 @@ class TXTExport(festim.Export):
         self.filename = filename
         self.header_format = header_format
         self._first_time = True
+        self.V_DG1 = None
+        self._solution = None
+        self.data = None
+        self.header = None
 
     @property
     def filename(self):
@@ -60,12 +72,17 @@ class TXTExport(festim.Export):
         return None
 
     def write(self, current_time, steady):
-        # create a DG1 functionspace
-        V_DG1 = f.FunctionSpace(self.function.function_space().mesh(), "DG", 1)
-
-        solution = f.project(self.function, V_DG1)
-        solution_column = np.transpose(solution.vector()[:])
         if self.is_it_time_to_export(current_time):
+            if self.V_DG1 is None:
+                mesh = self.function.function_space().mesh()
+                self.V_DG1 = f.FunctionSpace(mesh, "DG", 1)
+            V_DG1 = self.V_DG1
+            # project in the same Function at every export
+            if self._solution is None or self._solution.function_space() != V_DG1:
+                self._solution = f.Function(V_DG1)
+            f.project(self.function, V_DG1, function=self._solution)
+            solution_column = np.transpose(self._solution.vector()[:])
+
             # if the directory doesn't exist
             # create it
             dirname = os.path.dirname(self.filename)
@@ -80,21 +97,22 @@ class TXTExport(festim.Export):
                     header = "x,t=steady"
                 else:
                     header = f"x,t={format(current_time, self.header_format)}s"
-                x = f.interpolate(f.Expression("x[0]", degree=1), V_DG1)
-                x_column = np.transpose([x.vector()[:]])
-                data = np.column_stack([x_column, solution_column])
+                # dof coordinates are read with numpy rather than
+                # interpolating a compiled Expression
+                x_column = V_DG1.tabulate_dof_coordinates()[:, [0]]
+                self.data = np.column_stack([x_column, solution_column])
                 self._first_time = False
             else:
                 # Update the header
-                old_file = open(self.filename)
-                old_header = old_file.readline().split("\n")[0]
-                old_file.close()
-                header = old_header + f",t={format(current_time, self.header_format)}s"
-                # Append new column
-                old_columns = np.loadtxt(self.filename, delimiter=",", skiprows=1)
-                data = np.column_stack([old_columns, solution_column])
-
-            np.savetxt(self.filename, data, header=header, delimiter=",", comments="")
+                header = self.header + f",t={format(current_time, self.header_format)}s"
+                # Append new column to the data kept in memory instead of
+                # reading the whole file again
+                self.data = np.column_stack([self.data, solution_column])
+            self.header = header
+
+            np.savetxt(
+                self.filename, self.data, header=self.header, delimiter=",", comments=""
+            )
 
 
 class TXTExports:
@@ -113,15 +131,15 @@ class TXTExports:
     def __init__(
         self, fields=[], filenames=[], times=None, header_format=".2e"
     ) -> None:
-        msg = "TXTExports class will be deprecated in future versions of FESTIM"
-        warnings.warn(msg, DeprecationWarning)
-
-        self.fields = fields
-        if len(self.fields) != len(filenames):
+        if len(fields) != len(filenames):
             raise ValueError(
                 "Number of fields to be exported "
                 "doesn't match number of filenames in txt exports"
             )
+        msg = "TXTExports class will be deprecated in future versions of FESTIM"
+        warnings.warn(msg, DeprecationWarning)
+
+        self.fields = fields
         if times:
             self.times = sorted(times)
         else:
@@ -71,6 +71,10 @@ class Simulation:
         mobile (festim.Mobile): the mobile concentration (c_m or theta)
         t (fenics.Constant): the current time of simulation
         timer (fenics.timer): the elapsed time of simulation
+        last_display_time (float): the elapsed time when the progress was
+            last displayed
+        display_interval (float): the minimum elapsed time (in s) between
+            two refreshes of the progress line. Defaults to 0.2.
     """
 
     def __init__(
@@ -106,6 +110,8 @@ class Simulation:
         self.h_transport_problem = None
         self.t = 0  # Initialising time to 0s
         self.timer = None
+        self.last_display_time = None
+        self.display_interval = 0.2
 
     @property
     def traps(self):
@@ -272,9 +278,6 @@ class Simulation:
         # needed to avoid hanging behaviour in parrallel see #498
         self.mesh.mesh.bounding_box_tree()
 
-        self.V_DG1 = FunctionSpace(self.mesh.mesh, "DG", 1)
-        self.exports.V_DG1 = self.V_DG1
-
         # Define temperature
         if isinstance(self.T, festim.HeatTransferProblem):
             self.T.create_functions(self.materials, self.mesh, self.dt)
@@ -297,6 +300,11 @@ class Simulation:
 
         self.h_transport_problem.initialise(self.mesh, self.materials, self.dt)
 
+        # reuse the DG1 functionspace of the H transport problem rather than
+        # creating the same functionspace a second time
+        self.V_DG1 = self.h_transport_problem.V_DG1
+        self.exports.V_DG1 = self.V_DG1
+
         # raise warning if the derived quantities don't match the type of mesh
         # eg. SurfaceFlux is used with cylindrical mesh
         all_types_quantities = [
@@ -353,6 +361,7 @@ class Simulation:
             dict: output containing solutions, mesh, derived quantities
         """
         self.timer = Timer()  # start timer
+        self.last_display_time = None
 
         if self.settings.transient:
             self.run_transient()
@@ -420,16 +429,27 @@ class Simulation:
             self.dt.value.assign(self.settings.final_time - self.t)
 
     def display_time(self):
-        """Displays the current time"""
+        """Displays the current time. The progress line is refreshed at most
+        every self.display_interval so that small stepsizes don't flood the
+        terminal"""
+        elapsed_time = self.timer.elapsed()[0]
+        refresh = (
+            not np.isclose(self.t, self.settings.final_time, atol=0)
+            and self.log_level == 40
+        )
+        if refresh:
+            if (
+                self.last_display_time is not None
+                and elapsed_time - self.last_display_time < self.display_interval
+            ):
+                return
+            self.last_display_time = elapsed_time
+
         simulation_percentage = round(self.t / self.settings.final_time * 100, 2)
-        elapsed_time = round(self.timer.elapsed()[0], 1)
         msg = "{:.1f} %        ".format(simulation_percentage)
         msg += "{:.1e} s".format(self.t)
-        msg += "    Elapsed time so far: {:.1f} s".format(elapsed_time)
-        if (
-            not np.isclose(self.t, self.settings.final_time, atol=0)
-            and self.log_level == 40
-        ):
+        msg += "    Elapsed time so far: {:.1f} s".format(round(elapsed_time, 1))
+        if refresh:
             print(msg, end="\r")
         else:
             print(msg)
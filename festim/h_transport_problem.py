@@ -22,6 +22,8 @@ class HTransportProblem:
             ct2, ...)
         v (fenics.TestFunction): the test function
         u_n (fenics.Function): the "previous" function
+        u_backup (fenics.Function): copy of u taken before each solve so
+            that the solver can restart if it doesn't converge
         bcs (list): list of fenics.DirichletBC for H transport
     """
 
@@ -36,6 +38,7 @@ class HTransportProblem:
         self.u = None
         self.v = None
         self.u_n = None
+        self.u_backup = None
 
         self.boundary_conditions = []
         self.bcs = None
@@ -114,6 +117,7 @@ class HTransportProblem:
         self.u = Function(self.V, name="c")  # Function for concentrations
         self.v = TestFunction(self.V)  # TestFunction for concentrations
         self.u_n = Function(self.V, name="c_n")
+        self.u_backup = Function(self.V)
 
         if self.V.num_sub_spaces() == 0:
             self.mobile.solution = self.u
@@ -243,10 +247,11 @@ class HTransportProblem:
         festim.update_expressions(self.expressions, t)
 
         converged = False
-        u_ = Function(self.u.function_space())
-        u_.assign(self.u)
+        if self.u_backup is None:
+            self.u_backup = Function(self.u.function_space())
+        self.u_backup.assign(self.u)
         while converged is False:
-            self.u.assign(u_)
+            self.u.assign(self.u_backup)
             nb_it, converged = self.solve_once()
             if dt.adaptive_stepsize is not None or dt.milestones is not None:
                 dt.adapt(t, nb_it, converged)
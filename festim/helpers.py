@@ -44,6 +44,25 @@ def as_constant_or_expression(val):
         return Expression(expr_ccode, degree=2, t=0)
 
 
+def as_expression_of_t(value, degree):
+    """Creates a fenics Expression with a time parameter t from a number or
+    a sympy expression. Numbers are passed as a parameter rather than
+    written in the C++ code so that all the numbers share the same compiled
+    expression.
+
+    Args:
+        value (int, float, sp.Expr): the value of the expression
+        degree (int): the degree of the expression
+
+    Returns:
+        fenics.Expression: the expression
+    """
+    if isinstance(value, (int, float)):
+        return Expression("number", number=value, t=0, degree=degree)
+    else:
+        return Expression(sp.printing.ccode(value), t=0, degree=degree)
+
+
 def kJmol_to_eV(energy):
     """Converts an energy value given in units kJ mol^{-1} to eV
 
@@ -28,6 +28,7 @@ class Materials(list):
         self.heat_capacity = None
         self.density = None
         self.Q = None
+        self._materials_by_id = {}
 
     @property
     def materials(self):
@@ -47,23 +48,45 @@ class Materials(list):
             if not all(isinstance(t, festim.Material) for t in value):
                 raise TypeError("materials must be a list of festim.Material")
             super().__init__(value)
+            self._materials_by_id = {}
         else:
             raise TypeError("materials must be a list")
 
     def __setitem__(self, index, item):
         super().__setitem__(index, self._validate_material(item))
+        self._materials_by_id = {}
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._materials_by_id = {}
 
     def insert(self, index, item):
         super().insert(index, self._validate_material(item))
+        self._materials_by_id = {}
 
     def append(self, item):
         super().append(self._validate_material(item))
+        self._materials_by_id = {}
 
     def extend(self, other):
         if isinstance(other, type(self)):
             super().extend(other)
         else:
             super().extend(self._validate_material(item) for item in other)
+        self._materials_by_id = {}
+
+    def remove(self, item):
+        super().remove(item)
+        self._materials_by_id = {}
+
+    def pop(self, index=-1):
+        item = super().pop(index)
+        self._materials_by_id = {}
+        return item
+
+    def clear(self):
+        super().clear()
+        self._materials_by_id = {}
 
     def _validate_material(self, value):
         if isinstance(value, festim.Material):
@@ -208,7 +231,9 @@ class Materials(list):
         # TODO: add check for thermal cond for thermal flux computation
 
     def find_material_from_id(self, mat_id):
-        """Returns the material from a given id
+        """Returns the material from a given id.
+        Found materials are cached until the list of materials changes, as
+        this is called at every evaluation point of the properties.
 
         Args:
             mat_id (int): id of the wanted material
@@ -219,11 +244,14 @@ class Materials(list):
         Returns:
             festim.Material: the material that has the id mat_id
         """
+        if mat_id in self._materials_by_id:
+            return self._materials_by_id[mat_id]
         for material in self:
             mat_ids = material.id
             if type(mat_ids) is not list:
                 mat_ids = [mat_ids]
             if mat_id in mat_ids:
+                self._materials_by_id[mat_id] = material
                 return material
         raise ValueError("Couldn't find ID " + str(mat_id) + " in materials list")
 
@@ -382,7 +410,7 @@ class ArheniusCoeff(f.UserExpression):
         material = self._materials.find_material_from_id(subdomain_id)
         D_0 = getattr(material, self._pre_exp)
         E_D = getattr(material, self._E)
-        value[0] = D_0 * f.exp(-E_D / k_B / self._T(x))
+        value[0] = D_0 * np.exp(-E_D / k_B / self._T(x))
 
     def value_shape(self):
         return ()
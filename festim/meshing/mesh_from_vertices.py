@@ -28,7 +28,8 @@ class MeshFromVertices(Mesh1D):
         # the following is needed to avoid breaking in parrallel
         # see issue 497
         if f.MPI.comm_world.rank == 0:
-            vertices = sorted(np.unique(self.vertices))
+            # np.unique returns the vertices already sorted
+            vertices = np.unique(self.vertices)
             nb_points = len(vertices)
             nb_cells = nb_points - 1
             editor = f.MeshEditor()
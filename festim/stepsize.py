@@ -95,20 +95,22 @@ class Stepsize:
             dt_min = self.adaptive_stepsize["dt_min"]
             max_stepsize = self.adaptive_stepsize["max_stepsize"]
 
+            # work on a float and assign the fenics.Constant only once
+            value = float(self.value)
             if not converged:
-                self.value.assign(float(self.value) / change_ratio)
-                if float(self.value) < dt_min:
+                value /= change_ratio
+                if value < dt_min:
                     raise ValueError("stepsize reached minimal value")
             if nb_it < 5:
-                self.value.assign(float(self.value) * change_ratio)
+                value *= change_ratio
             else:
-                self.value.assign(float(self.value) / change_ratio)
+                value /= change_ratio
 
             if callable(max_stepsize):
                 max_stepsize = max_stepsize(t)
             if max_stepsize is not None:
-                if float(self.value) > max_stepsize:
-                    self.value.assign(max_stepsize)
+                value = min(value, max_stepsize)
+            self.value.assign(value)
 
         # adapt for next milestone
         next_milestone = self.next_milestone(t)
@@ -1,3 +1,4 @@
+import festim
 import sympy as sp
 import fenics as f
 
@@ -27,6 +28,20 @@ class Temperature:
         self.value = value
         self.expression = None
 
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+        # the time dependence is only worked out when the value changes
+        # and not every time is_steady_state() is called
+        if value is None:
+            self._steady_state = None
+        else:
+            self._steady_state = festim.t not in sp.sympify(value).free_symbols
+
     def create_functions(self, mesh):
         """Creates functions self.T, self.T_n
 
@@ -41,14 +56,20 @@ class Temperature:
         self.T_n.assign(self.T)
 
     def update(self, t):
-        """Updates T_n, expression, and T with respect to time
+        """Updates T_n, expression, and T with respect to time.
+        Nothing is updated if the temperature doesn't depend on time: T and
+        T_n are then already equal after create_functions.
 
         Args:
             t (float): the time
         """
+        if self.is_steady_state():
+            return
         self.T_n.assign(self.T)
         self.expression.t = t
-        self.T.assign(f.interpolate(self.expression, self.T.function_space()))
+        # interpolate the compiled expression in place rather than in a new
+        # Function at every time step
+        self.T.interpolate(self.expression)
 
     def is_steady_state(self):
-        return "t" not in sp.printing.ccode(self.value)
+        return self._steady_state
@@ -31,6 +31,8 @@ class HeatTransferProblem(festim.Temperature):
         sources (list): contains festim.Source objects for volumetric heat
             sources
         boundary_conditions (list): contains festim.BoundaryConditions
+        newton_solver (fenics.NonlinearVariationalSolver): the Newton solver
+            of the heat transfer problem
     """
 
     def __init__(
@@ -52,6 +54,7 @@ class HeatTransferProblem(festim.Temperature):
 
         self.F = 0
         self.v_T = None
+        self.newton_solver = None
         self.sources = []
         self.boundary_conditions = []
         self.sub_expressions = []
@@ -90,21 +93,11 @@ class HeatTransferProblem(festim.Temperature):
 
         self.define_variational_problem(materials, mesh, dt)
         self.create_dirichlet_bcs(mesh.surface_markers)
+        self.define_newton_solver()
 
         if not self.transient:
             print("Solving stationary heat equation")
-            dT = f.TrialFunction(self.T.function_space())
-            JT = f.derivative(self.F, self.T, dT)
-            problem = f.NonlinearVariationalProblem(
-                self.F, self.T, self.dirichlet_bcs, JT
-            )
-            solver = f.NonlinearVariationalSolver(problem)
-            newton_solver_prm = solver.parameters["newton_solver"]
-            newton_solver_prm["absolute_tolerance"] = self.absolute_tolerance
-            newton_solver_prm["relative_tolerance"] = self.relative_tolerance
-            newton_solver_prm["maximum_iterations"] = self.maximum_iterations
-            newton_solver_prm["linear_solver"] = self.linear_solver
-            solver.solve()
+            self.newton_solver.solve()
             self.T_n.assign(self.T)
 
     def define_variational_problem(self, materials, mesh, dt=None):
@@ -183,6 +176,22 @@ class HeatTransferProblem(festim.Temperature):
                 for surf in bc.surfaces:
                     self.F += -bc.form * self.v_T * mesh.ds(surf)
 
+    def define_newton_solver(self):
+        """Creates the Jacobian, the variational problem and the Newton
+        solver of the heat transfer problem and stores the solver in
+        self.newton_solver. The solver is created once and reused at each
+        time step.
+        """
+        dT = f.TrialFunction(self.T.function_space())
+        JT = f.derivative(self.F, self.T, dT)  # Define the Jacobian
+        problem = f.NonlinearVariationalProblem(self.F, self.T, self.dirichlet_bcs, JT)
+        self.newton_solver = f.NonlinearVariationalSolver(problem)
+        newton_solver_prm = self.newton_solver.parameters["newton_solver"]
+        newton_solver_prm["absolute_tolerance"] = self.absolute_tolerance
+        newton_solver_prm["relative_tolerance"] = self.relative_tolerance
+        newton_solver_prm["maximum_iterations"] = self.maximum_iterations
+        newton_solver_prm["linear_solver"] = self.linear_solver
+
     def create_dirichlet_bcs(self, surface_markers):
         """Creates a list of fenics.DirichletBC and add time dependent
         expressions to .sub_expressions
@@ -212,18 +221,7 @@ class HeatTransferProblem(festim.Temperature):
         if self.transient:
             festim.update_expressions(self.sub_expressions, t)
             # Solve heat transfers
-            dT = f.TrialFunction(self.T.function_space())
-            JT = f.derivative(self.F, self.T, dT)  # Define the Jacobian
-            problem = f.NonlinearVariationalProblem(
-                self.F, self.T, self.dirichlet_bcs, JT
-            )
-            solver = f.NonlinearVariationalSolver(problem)
-            newton_solver_prm = solver.parameters["newton_solver"]
-            newton_solver_prm["absolute_tolerance"] = self.absolute_tolerance
-            newton_solver_prm["relative_tolerance"] = self.relative_tolerance
-            newton_solver_prm["maximum_iterations"] = self.maximum_iterations
-            newton_solver_prm["linear_solver"] = self.linear_solver
-            solver.solve()
+            self.newton_solver.solve()
             self.T_n.assign(self.T)
 
     def is_steady_state(self):
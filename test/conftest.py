@@ -0,0 +1,21 @@
+import fenics as f
+import pytest
+
+
+@pytest.fixture(scope="session")
+def unit_interval_mesh():
+    """A unit interval mesh with 8 cells, built once for the whole session"""
+    return f.UnitIntervalMesh(8)
+
+
+@pytest.fixture(scope="session")
+def V_CG1(unit_interval_mesh):
+    """A CG1 functionspace on unit_interval_mesh, built once for the whole
+    session"""
+    return f.FunctionSpace(unit_interval_mesh, "CG", 1)
+
+
+@pytest.fixture(scope="session")
+def unit_square_mesh():
+    """A 4x4 unit square mesh, built once for the whole session"""
+    return f.UnitSquareMesh(4, 4)
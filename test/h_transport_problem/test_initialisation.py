@@ -2,7 +2,6 @@ import festim
 import pytest
 import fenics
 from pathlib import Path
-import os
 
 
 def test_initialisation_from_xdmf(tmpdir):
@@ -2,15 +2,14 @@ import festim
 import fenics as f
 
 
-def test_default_dt_min_value():
+def test_default_dt_min_value(V_CG1):
     """
     Tests that the adaptive stepsize works with a default value and that no
     error is raised
     """
 
     # build
-    mesh = f.UnitIntervalMesh(8)
-    V = f.FunctionSpace(mesh, "CG", 1)
+    V = V_CG1
 
     t = 0
     dt = festim.Stepsize(
@@ -40,11 +39,10 @@ def test_default_dt_min_value():
     my_problem.update(t, dt)
 
 
-def test_solve_once_jacobian_is_none():
+def test_solve_once_jacobian_is_none(V_CG1):
     """Checks that solve_once() works when the jacobian (J) is None (defaults)"""
     # build
-    mesh = f.UnitIntervalMesh(8)
-    V = f.FunctionSpace(mesh, "CG", 1)
+    V = V_CG1
 
     my_settings = festim.Settings(
         absolute_tolerance=1e-10, relative_tolerance=1e-10, maximum_iterations=50
@@ -67,11 +65,10 @@ def test_solve_once_jacobian_is_none():
     assert converged
 
 
-def test_solve_once_returns_false():
+def test_solve_once_returns_false(V_CG1):
     """Checks that solve_once() returns False when didn't converge"""
     # build
-    mesh = f.UnitIntervalMesh(8)
-    V = f.FunctionSpace(mesh, "CG", 1)
+    V = V_CG1
 
     my_settings = festim.Settings(
         absolute_tolerance=1e-20, relative_tolerance=1e-20, maximum_iterations=1
@@ -94,11 +91,10 @@ def test_solve_once_returns_false():
     assert not converged
 
 
-def test_solve_once_linear_solver_mumps():
+def test_solve_once_linear_solver_mumps(V_CG1):
     """Checks that solve_once() works when an alternative linear solver is used rather than the default"""
     # build
-    mesh = f.UnitIntervalMesh(8)
-    V = f.FunctionSpace(mesh, "CG", 1)
+    V = V_CG1
 
     my_settings = festim.Settings(
         absolute_tolerance=1e-10,
@@ -1,6 +1,5 @@
 import festim
 import pytest
-import fenics as f
 
 
 def test_create_functions_linear_solver_mumps():
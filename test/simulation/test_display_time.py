@@ -0,0 +1,25 @@
+import festim as F
+import fenics as f
+
+
+def test_display_time_refresh_is_throttled(capsys):
+    """Checks that the progress line isn't refreshed twice within
+    display_interval and that the final time is always displayed"""
+    my_sim = F.Simulation(log_level=40)
+    my_sim.settings = F.Settings(1e-10, 1e-10, final_time=10)
+    my_sim.timer = f.Timer()
+    my_sim.display_interval = 1e3
+
+    my_sim.t = 1
+    my_sim.display_time()
+    assert "10.0 %" in capsys.readouterr().out
+
+    # within display_interval: nothing is printed
+    my_sim.t = 2
+    my_sim.display_time()
+    assert capsys.readouterr().out == ""
+
+    # the final time is always printed
+    my_sim.t = 10
+    my_sim.display_time()
+    assert "100.0 %" in capsys.readouterr().out
@@ -23,8 +23,6 @@ class TestPostProcessing:
 
         my_sim.mesh.define_measures(my_sim.materials)
 
-        my_sim.V_DG1 = f.FunctionSpace(my_sim.mesh.mesh, "DG", 1)
-
         my_sim.T = festim.Temperature(value=20)
         my_sim.T.create_functions(my_sim.mesh)
         my_sim.h_transport_problem = festim.HTransportProblem(
@@ -36,6 +34,9 @@ class TestPostProcessing:
         )
         my_sim.h_transport_problem.define_function_space(my_sim.mesh)
         my_sim.h_transport_problem.initialise_concentrations()
+        # reuse the DG1 functionspace of the H transport problem like
+        # Simulation.initialise does
+        my_sim.V_DG1 = my_sim.h_transport_problem.V_DG1
 
         my_sim.materials.create_properties(my_sim.mesh.volume_markers, my_sim.T.T)
         my_sim.exports = festim.Exports([])
@@ -118,7 +118,7 @@ def test_wrong_value_for_bc_field(field):
     """
     sim = F.Simulation()
 
-    sim.mesh = F.MeshFromVertices(np.linspace(0, 1, num=50))
+    sim.mesh = F.MeshFromVertices(np.linspace(0, 1, num=3))
 
     sim.T = F.Temperature(500)
 
@@ -143,7 +143,7 @@ def test_error_DirichletBC_on_same_surface(field, surfaces):
     """
     sim = F.Simulation()
 
-    sim.mesh = F.MeshFromVertices(np.linspace(0, 1, num=10))
+    sim.mesh = F.MeshFromVertices(np.linspace(0, 1, num=3))
 
     sim.T = F.Temperature(500)
 
@@ -187,12 +187,11 @@ def test_txt_export_desired_times(tmp_path, final_time, stepsize, export_times):
 
     assert os.path.exists(my_export.filename)
 
-    data = np.genfromtxt(
-        my_export.filename,
-        skip_header=1,
-        delimiter=",",
-    )
-    assert len(data[0, :]) == len(my_export.times) + 1
+    # only the first row is needed to count the columns
+    with open(my_export.filename) as file:
+        file.readline()  # skip the header
+        first_row = file.readline().split(",")
+    assert len(first_row) == len(my_export.times) + 1
 
 
 def test_txt_export_all_times(tmp_path):
@@ -218,12 +217,11 @@ def test_txt_export_all_times(tmp_path):
 
     assert os.path.exists(my_export.filename)
 
-    data = np.genfromtxt(
-        my_export.filename,
-        skip_header=1,
-        delimiter=",",
-    )
-    assert len(data[0, :]) == 11
+    # only the first row is needed to count the columns
+    with open(my_export.filename) as file:
+        file.readline()  # skip the header
+        first_row = file.readline().split(",")
+    assert len(first_row) == 11
 
 
 def test_txt_export_steady_state(tmp_path):
@@ -1,11 +1,12 @@
 import festim
+from festim.boundary_conditions.dirichlets.dc_imp import dc_imp
 import fenics
 import pytest
 import sympy as sp
 import numpy as np
 
 
-def test_define_dirichlet_bcs_theta():
+def test_define_dirichlet_bcs_theta(unit_square_mesh):
     """
     Test the function apply_boundary_condition()
     when conservation of chemical potential is
@@ -22,7 +23,7 @@ def test_define_dirichlet_bcs_theta():
     E_S1 = 0.1
     E_S2 = 0.2
 
-    mesh = fenics.UnitSquareMesh(4, 4)
+    mesh = unit_square_mesh
     V = fenics.FunctionSpace(mesh, "P", 1)
     u = fenics.Function(V)
     v = fenics.TestFunction(V)
@@ -95,7 +96,7 @@ def test_define_dirichlet_bcs_theta():
         )
 
 
-def test_bc_recomb():
+def test_bc_recomb(unit_square_mesh):
     """Test the function boundary_conditions.define_dirichlet_bcs
     with bc type dc_imp
     """
@@ -109,7 +110,7 @@ def test_bc_recomb():
     E_Kd = 0.1
     P = 1.5
 
-    mesh = fenics.UnitSquareMesh(4, 4)
+    mesh = unit_square_mesh
     my_mesh = festim.Mesh(mesh)
     my_mesh.dx = fenics.dx()
     my_mesh.ds = fenics.ds()
@@ -156,7 +157,7 @@ def test_bc_recomb():
             )
 
 
-def test_bc_recomb_instant_recomb():
+def test_bc_recomb_instant_recomb(unit_square_mesh):
     """Test the function boundary_conditions.define_dirichlet_bcs
     with bc type dc_imp (with instantaneous recombination)
     """
@@ -166,7 +167,7 @@ def test_bc_recomb_instant_recomb():
     E_D = 0.25
 
     # Set up
-    mesh = fenics.UnitSquareMesh(4, 4)
+    mesh = unit_square_mesh
     my_mesh = festim.Mesh(mesh)
     my_mesh.dx = fenics.dx()
     my_mesh.ds = fenics.ds()
@@ -197,7 +198,7 @@ def test_bc_recomb_instant_recomb():
             assert np.isclose(expressions[-1](x_, 0.5), float(val_phi * val_R_p / D))
 
 
-def test_bc_recomb_chemical_pot():
+def test_bc_recomb_chemical_pot(unit_square_mesh):
     """Tests the function boundary_conditions.define_dirichlet_bcs()
     with type dc_imp and conservation of chemical potential
     """
@@ -212,7 +213,7 @@ def test_bc_recomb_chemical_pot():
     E_S1 = 0.1
     E_S2 = 0.2
 
-    mesh = fenics.UnitSquareMesh(4, 4)
+    mesh = unit_square_mesh
     my_mesh = festim.Mesh(mesh)
     my_mesh.dx = fenics.dx()
     my_mesh.ds = fenics.ds()
@@ -529,10 +530,10 @@ def test_mass_flux():
     my_BC.create_form(T, c)
 
 
-def test_string_for_field_in_dirichletbc():
+def test_string_for_field_in_dirichletbc(unit_square_mesh):
     """Test catching issue #462"""
     # build
-    mesh = fenics.UnitSquareMesh(4, 4)
+    mesh = unit_square_mesh
 
     surface_marker = fenics.MeshFunction("size_t", mesh, 1, 0)
 
@@ -543,6 +544,15 @@ def test_string_for_field_in_dirichletbc():
     bc.create_dirichletbc(V, fenics.Constant(1), surface_marker)
 
 
+def test_dirichletbc_create_expression():
+    """Checks that DirichletBC.create_expression passes numbers to the
+    expression as a parameter"""
+    my_bc = festim.DirichletBC(surfaces=[1], value=2, field=0)
+    my_bc.create_expression(fenics.Constant(1))
+
+    assert my_bc.expression.number == 2
+
+
 def custom_fun(T, solute, param1):
     return 2 * T + solute - param1
 
@@ -599,3 +609,21 @@ def test_dissoc_flux():
 
     my_BC = festim.DissociationFlux(surfaces=[0], Kd_0=expr, E_Kd=expr, P=1)
     my_BC.create_form(T, None)
+
+
+def test_dc_imp_dissociation_without_pressure():
+    """Checks that dc_imp doesn't fail and ignores the dissociation term
+    when Kd_0 is given but P is None
+    """
+    prms = {
+        "T": 500,
+        "phi": 1e18,
+        "R_p": 1e-9,
+        "D_0": 1e-7,
+        "E_D": 0.2,
+        "Kr_0": 1e-20,
+        "E_Kr": 0.1,
+    }
+    expected = dc_imp(**prms)
+    computed = dc_imp(**prms, Kd_0=1e-5, E_Kd=0.3, P=None)
+    assert float(computed) == pytest.approx(float(expected))
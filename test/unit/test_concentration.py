@@ -21,6 +21,13 @@ class TestGetComp:
             for x in [2, 5, 0, 6]:
                 assert comp(x) == 1 + t - x
 
+    def test_get_comp_from_number(self):
+        """Checks that numbers are passed to the expression as a parameter"""
+        my_conc = festim.Concentration()
+        comp = my_conc.get_comp(self.V, 2)
+
+        assert comp.number == 2
+
     def test_get_comp_from_xdmf(self, tmpdir):
         # build
         value = 1 + festim.t - festim.x
@@ -1,5 +1,6 @@
 from festim import AverageSurface
 import fenics as f
+from .tools import c_1D, dx_1D
 import pytest
 
 
@@ -21,16 +22,8 @@ def test_title(field, surface):
 class TestCompute:
     """Test that the average surface export computes the correct value"""
 
-    mesh = f.UnitIntervalMesh(10)
-    V = f.FunctionSpace(mesh, "P", 1)
-
-    c = f.interpolate(f.Expression("x[0]", degree=1), V)
-
-    left = f.CompiledSubDomain("x[0] < 0.5")
-    surface_markers = f.MeshFunction("size_t", mesh, 1, 1)
-    left.mark(surface_markers, 2)
-
-    ds = f.Measure("dx", domain=mesh, subdomain_data=surface_markers)
+    c = c_1D
+    ds = dx_1D
 
     surface = 1
     my_average = AverageSurface("solute", surface)
@@ -1,5 +1,6 @@
 from festim import AverageVolume
 import fenics as f
+from .tools import c_1D, dx_1D
 import pytest
 
 
@@ -21,16 +22,8 @@ def test_title(field, volume):
 class TestCompute:
     """Test that the average volume export computes the correct value"""
 
-    mesh = f.UnitIntervalMesh(10)
-    V = f.FunctionSpace(mesh, "P", 1)
-
-    c = f.interpolate(f.Expression("x[0]", degree=1), V)
-
-    left = f.CompiledSubDomain("x[0] < 0.5")
-    volume_markers = f.MeshFunction("size_t", mesh, 1, 1)
-    left.mark(volume_markers, 2)
-
-    dx = f.Measure("dx", domain=mesh, subdomain_data=volume_markers)
+    c = c_1D
+    dx = dx_1D
 
     volume = 1
     my_average = AverageVolume("solute", volume)
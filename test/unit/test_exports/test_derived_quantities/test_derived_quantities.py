@@ -180,6 +180,12 @@ class TestAssignMeasuresToQuantities:
         for quantity in self.my_quantities:
             assert quantity.n == self.n
 
+    def test_quantities_share_measure_sizes(self):
+        """Check that all quantities share the same cache of measure sizes"""
+        measure_sizes = self.my_quantities[0].measure_sizes
+        for quantity in self.my_quantities:
+            assert quantity.measure_sizes is measure_sizes
+
 
 class TestAssignPropertiesToQuantities:
     """
@@ -259,12 +265,13 @@ class TestCompute:
     ds = f.Measure("ds", domain=mesh, subdomain_data=surface_markers)
     n = f.FacetNormal(mesh)
 
+    # all the properties are equal and read-only here so share one Function
     T = f.interpolate(f.Constant(2), V)
     my_mats = Materials([])
-    my_mats.D = f.interpolate(f.Constant(2), V)
-    my_mats.S = f.interpolate(f.Constant(2), V)
-    my_mats.H = f.interpolate(f.Constant(2), V)
-    my_mats.thermal_cond = f.interpolate(f.Constant(2), V)
+    my_mats.D = T
+    my_mats.S = T
+    my_mats.H = T
+    my_mats.thermal_cond = T
 
     def test_simple(self):
         """Check for the case of one festim.DerivedQuantity object"""
@@ -377,6 +384,24 @@ class TestWrite:
 
         assert os.path.exists(filename)
 
+    def test_write_appends_new_rows(self, folder, my_derived_quantities):
+        """Checks that successive calls of write() add the new rows to the
+        file and that resetting data writes the file again"""
+        filename = "{}/my_file.csv".format(folder)
+        my_derived_quantities.filename = filename
+        my_derived_quantities.write()
+        my_derived_quantities.data.append([4, 5, 6])
+        my_derived_quantities.write()
+
+        with open(filename) as file:
+            assert file.read().splitlines() == ["a,b,c", "1,2,3", "1,2,3", "4,5,6"]
+
+        my_derived_quantities.data = [["a", "b", "c"], [7, 8, 9]]
+        my_derived_quantities.write()
+
+        with open(filename) as file:
+            assert file.read().splitlines() == ["a,b,c", "7,8,9"]
+
 
 class TestFilter:
     """Tests the filter method of DerivedQUantities"""
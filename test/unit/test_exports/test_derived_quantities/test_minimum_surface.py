@@ -1,5 +1,6 @@
 from festim import MinimumSurface
 import fenics as f
+from .tools import V_1D, c_1D, markers_1D, dx_1D
 import numpy as np
 import pytest
 
@@ -22,16 +23,11 @@ def test_title(field, surface):
 class TestCompute:
     """Test that the minimum surface export computes the correct value"""
 
-    mesh = f.UnitIntervalMesh(10)
-    V = f.FunctionSpace(mesh, "P", 1)
+    V = V_1D
+    c = c_1D
 
-    c = f.interpolate(f.Expression("x[0]", degree=1), V)
-
-    left = f.CompiledSubDomain("x[0] < 0.5")
-    surface_markers = f.MeshFunction("size_t", mesh, 1, 1)
-    left.mark(surface_markers, 2)
-
-    dx = f.Measure("dx", domain=mesh, subdomain_data=surface_markers)
+    surface_markers = markers_1D
+    dx = dx_1D
 
     surface = 1
     my_min = MinimumSurface("solute", surface)
@@ -1,5 +1,6 @@
 from festim import MinimumVolume
 import fenics as f
+from .tools import V_1D, c_1D, markers_1D, dx_1D
 import numpy as np
 import pytest
 
@@ -22,16 +23,11 @@ def test_title(field, volume):
 class TestCompute:
     """Test that the minimum volume export computes the correct value"""
 
-    mesh = f.UnitIntervalMesh(10)
-    V = f.FunctionSpace(mesh, "P", 1)
+    V = V_1D
+    c = c_1D
 
-    c = f.interpolate(f.Expression("x[0]", degree=1), V)
-
-    left = f.CompiledSubDomain("x[0] < 0.5")
-    volume_markers = f.MeshFunction("size_t", mesh, 1, 1)
-    left.mark(volume_markers, 2)
-
-    dx = f.Measure("dx", domain=mesh, subdomain_data=volume_markers)
+    volume_markers = markers_1D
+    dx = dx_1D
 
     volume = 1
     my_min = MinimumVolume("solute", volume)
@@ -1,6 +1,6 @@
 from festim import PointValue
-import fenics as f
 import pytest
+from .tools import c_1D, c_3D
 
 
 @pytest.mark.parametrize("field", ["solute", "T"])
@@ -17,14 +17,9 @@ def test_title(field):
     assert my_value.title == "{} value at [{}]".format(field, x)
 
 
-@pytest.mark.parametrize(
-    "mesh,x", [(f.UnitIntervalMesh(10), 1), (f.UnitCubeMesh(10, 10, 10), (1, 0, 1))]
-)
-def test_point_compute(mesh, x):
+@pytest.mark.parametrize("c,x", [(c_1D, 1), (c_3D, (1, 0, 1))])
+def test_point_compute(c, x):
     """Test that the point value export computes the correct value"""
-    V = f.FunctionSpace(mesh, "P", 1)
-    c = f.interpolate(f.Expression("x[0]", degree=1), V)
-
     my_value = PointValue("solute", x)
     my_value.function = c
 
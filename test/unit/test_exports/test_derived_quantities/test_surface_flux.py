@@ -4,7 +4,7 @@ import math
 import numpy as np
 import pytest
 from festim import SurfaceFlux, k_B
-from .tools import c_1D, c_2D, c_3D
+from .tools import mesh_1D, V_1D, c_1D, c_2D, c_3D
 
 
 @pytest.mark.parametrize("field,surface", [("solute", 1), ("T", 2)])
@@ -25,10 +25,9 @@ def test_title(field, surface):
 class TestCompute:
     """Test that the surface flux export computes the correct value"""
 
-    mesh = f.UnitIntervalMesh(10)
-    V = f.FunctionSpace(mesh, "P", 1)
-
-    c = f.interpolate(f.Expression("x[0]", degree=1), V)
+    mesh = mesh_1D
+    V = V_1D
+    c = c_1D
     T = f.interpolate(f.Expression("2*x[0]", degree=1), V)
 
     left = f.CompiledSubDomain("near(x[0], 0) && on_boundary")
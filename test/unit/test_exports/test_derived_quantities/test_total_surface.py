@@ -1,8 +1,7 @@
-from this import s
 from festim import TotalSurface
 import fenics as f
 import pytest
-from .tools import c_1D, c_2D, c_3D
+from .tools import c_1D, dx_1D, c_2D, c_3D
 import pytest
 
 
@@ -24,16 +23,8 @@ def test_title(field, surface):
 class TestCompute:
     """Test that the total surface export computes the correct value"""
 
-    mesh = f.UnitIntervalMesh(10)
-    V = f.FunctionSpace(mesh, "P", 1)
-
-    c = f.interpolate(f.Expression("x[0]", degree=1), V)
-
-    left = f.CompiledSubDomain("x[0] < 0.5")
-    surface_markers = f.MeshFunction("size_t", mesh, 1, 1)
-    left.mark(surface_markers, 2)
-
-    ds = f.Measure("dx", domain=mesh, subdomain_data=surface_markers)
+    c = c_1D
+    ds = dx_1D
 
     surface = 1
     my_total = TotalSurface("solute", surface)
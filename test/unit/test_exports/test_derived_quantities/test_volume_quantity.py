@@ -1,4 +1,3 @@
-from nis import match
 import festim as F
 import pytest
 
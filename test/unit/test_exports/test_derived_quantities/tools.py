@@ -4,6 +4,11 @@ mesh_1D = f.UnitIntervalMesh(10)
 V_1D = f.FunctionSpace(mesh_1D, "P", 1)
 c_1D = f.interpolate(f.Expression("x[0]", degree=1), V_1D)
 
+# left half marked 2, right half marked 1
+markers_1D = f.MeshFunction("size_t", mesh_1D, 1, 1)
+f.CompiledSubDomain("x[0] < 0.5").mark(markers_1D, 2)
+dx_1D = f.Measure("dx", domain=mesh_1D, subdomain_data=markers_1D)
+
 mesh_2D = f.UnitSquareMesh(10, 10)
 V_2D = f.FunctionSpace(mesh_2D, "P", 1)
 c_2D = f.interpolate(f.Expression("x[0]", degree=1), V_2D)
@@ -66,7 +66,8 @@ def test_trap_density_xdmf_export_write(tmpdir):
         tmpdir (os.PathLike): path to the pytest temporary folder
     """
     # build
-    mesh = UnitSquareMesh(30, 30)
+    # the density is linear so a coarse mesh represents it exactly
+    mesh = UnitSquareMesh(8, 8)
     V = FunctionSpace(mesh, "CG", 1)
     V_vector = VectorFunctionSpace(mesh, "CG", 1, 2)
     density_expr = 2 + festim.x + festim.y
@@ -1,24 +1,34 @@
-from festim import TXTExport, Stepsize
+from festim import TXTExport
 import fenics as f
+import numpy as np
 import os
 import pytest
 from pathlib import Path
 
 
 class TestWrite:
+    # the mesh and functionspaces are only built once for all the tests
+    @pytest.fixture(scope="class")
+    def mesh(self):
+        return f.UnitIntervalMesh(10)
+
+    @pytest.fixture(scope="class")
+    def V(self, mesh):
+        return f.FunctionSpace(mesh, "P", 1)
+
+    @pytest.fixture(scope="class")
+    def V_vector(self, mesh):
+        return f.VectorFunctionSpace(mesh, "P", 1, 2)
+
     @pytest.fixture
-    def function(self):
-        mesh = f.UnitIntervalMesh(10)
-        V = f.FunctionSpace(mesh, "P", 1)
+    def function(self, V):
         u = f.Function(V)
 
         return u
 
     @pytest.fixture
-    def function_subspace(self):
-        mesh = f.UnitIntervalMesh(10)
-        V = f.VectorFunctionSpace(mesh, "P", 1, 2)
-        u = f.Function(V)
+    def function_subspace(self, V_vector):
+        u = f.Function(V_vector)
 
         return u.sub(0)
 
@@ -68,13 +78,35 @@ class TestWrite:
 
         assert os.path.exists(my_export.filename)
 
-    def test_error_filename_endswith_txt(self, my_export):
-        with pytest.raises(ValueError, match="filename must end with .txt"):
-            my_export.filename = "coucou"
+    def test_file_content(self, my_export, V):
+        """Checks the header, the x column and the data of a file written at
+        two export times"""
+        u = f.Function(V)
+        my_export.function = u
+        for t in [1, 2]:
+            u.interpolate(f.Expression("t*x[0]", t=t, degree=1))
+            my_export.write(current_time=t, steady=False)
+
+        with open(my_export.filename) as file:
+            header = file.readline().rstrip()
+        data = np.genfromtxt(my_export.filename, delimiter=",", skip_header=1)
+        x = f.FunctionSpace(V.mesh(), "DG", 1).tabulate_dof_coordinates()[:, 0]
+
+        assert header == "x,t=1.00e+00s,t=2.00e+00s"
+        assert data.shape == (len(x), 3)
+        assert np.array_equal(data[:, 0], x)
+        assert np.allclose(data[:, 1], x)
+        assert np.allclose(data[:, 2], 2 * x)
+
+
+def test_error_filename_endswith_txt():
+    with pytest.raises(ValueError, match="filename must end with .txt"):
+        TXTExport("solute", filename="coucou")
+
 
-    def test_error_filename_not_a_str(self, my_export):
-        with pytest.raises(TypeError, match="filename must be a string"):
-            my_export.filename = 2
+def test_error_filename_not_a_str():
+    with pytest.raises(TypeError, match="filename must be a string"):
+        TXTExport("solute", filename=2)
 
 
 class TestIsItTimeToExport:
@@ -1,6 +1,4 @@
 from festim import TXTExports
-import fenics as f
-import os
 import pytest
 from pathlib import Path
 
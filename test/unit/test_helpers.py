@@ -5,10 +5,12 @@ from festim import (
     as_constant,
     as_expression,
     as_constant_or_expression,
+    as_expression_of_t,
     t,
 )
 from fenics import Constant, Expression, UserExpression
 import pytest
+import sympy as sp
 
 
 def test_energy_converter():
@@ -61,3 +63,14 @@ def test_as_expression(expression, type):
 )
 def test_as_constant_or_expression(expression, type):
     assert isinstance(as_constant_or_expression(expression), type)
+
+
+@pytest.mark.parametrize("value", [0, 2, 1.5e20, 2 + t])
+def test_as_expression_of_t(value):
+    """Checks that as_expression_of_t gives the expected value for numbers
+    (passed as a parameter) and sympy expressions"""
+    expression = as_expression_of_t(value, degree=1)
+    expression.t = 3
+
+    assert isinstance(expression, Expression)
+    assert expression(0.5) == pytest.approx(float(sp.sympify(value).subs(t, 3)))
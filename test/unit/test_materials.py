@@ -26,6 +26,23 @@ def test_find_material_from_id_with_several_ids():
     assert my_Mats.find_material_from_id(2) == mat_1
 
 
+def test_find_material_from_id_after_changing_materials():
+    """Tests that find_material_from_id() doesn't return a cached material
+    once the list of materials has changed
+    """
+    mat_1 = F.Material(id=1, D_0=None, E_D=None)
+    mat_2 = F.Material(id=1, D_0=None, E_D=None)
+    my_Mats = F.Materials([mat_1])
+    assert my_Mats.find_material_from_id(1) == mat_1
+
+    my_Mats[0] = mat_2
+    assert my_Mats.find_material_from_id(1) == mat_2
+
+    my_Mats.pop()
+    with pytest.raises(ValueError, match="Couldn't find ID 1"):
+        my_Mats.find_material_from_id(1)
+
+
 def test_find_material_from_id_unfound_id():
     """
     Tests the function find_material_from_id with a list of materials
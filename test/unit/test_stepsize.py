@@ -94,12 +94,8 @@ def test_next_milestone():
 
     # Check that the next milestone is correct for each t value
     for t, expected_milestone in zip(t_values, expected_milestones):
-        next_milestone = step_size.next_milestone(t)
-        assert (
-            np.isclose(next_milestone, expected_milestone)
-            if expected_milestone is not None
-            else next_milestone is None
-        )
+        # milestones are returned as given, so they compare exactly
+        assert step_size.next_milestone(t) == expected_milestone
 
 
 def test_DeprecationWarning_t_stop():
@@ -240,3 +240,57 @@ def test_temperature_from_xdmf(tmpdir):
     temperature = festim.TemperatureFromXDMF(T_file, "T")
 
     assert temperature.is_steady_state()
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (300, True),
+        (300 + festim.x, True),
+        (300 + festim.x**0.5, True),
+        (300 + festim.t, False),
+    ],
+)
+def test_is_steady_state(value, expected):
+    """Checks that Temperature.is_steady_state() returns True only when the
+    value doesn't depend on time
+
+    Args:
+        value (sp.Expr, int, float): the value of the temperature
+        expected (bool): the expected result of is_steady_state()
+    """
+    my_temp = festim.Temperature(value=value)
+    assert my_temp.is_steady_state() == expected
+
+
+def test_is_steady_state_updated_with_value():
+    """Checks that Temperature.is_steady_state() follows changes of the value"""
+    my_temp = festim.Temperature(value=300)
+    my_temp.value = 300 + festim.t
+    assert not my_temp.is_steady_state()
+
+
+def test_update_steady_state():
+    """Checks that Temperature.update() leaves T and T_n unchanged when the
+    temperature doesn't depend on time"""
+    my_temp = festim.Temperature(value=300 + 10 * festim.x)
+    my_temp.create_functions(festim.Mesh(fenics.UnitIntervalMesh(10)))
+    T_before = my_temp.T.vector().get_local()
+    T_n_before = my_temp.T_n.vector().get_local()
+
+    my_temp.update(t=5)
+
+    assert np.array_equal(my_temp.T.vector().get_local(), T_before)
+    assert np.array_equal(my_temp.T_n.vector().get_local(), T_n_before)
+
+
+def test_update_transient():
+    """Checks that Temperature.update() interpolates T again and stores the
+    previous value in T_n when the temperature depends on time"""
+    my_temp = festim.Temperature(value=300 + 10 * festim.t)
+    my_temp.create_functions(festim.Mesh(fenics.UnitIntervalMesh(10)))
+
+    my_temp.update(t=2)
+
+    assert np.allclose(my_temp.T.vector().get_local(), 320)
+    assert np.allclose(my_temp.T_n.vector().get_local(), 300)